@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.db.models import Count, Q
 
 from award.models import Lecturer, Nomination, Verification
 
@@ -10,13 +11,19 @@ class LecturerAdmin(admin.ModelAdmin):
     ordering = ('first_name', 'last_name')
     search_fields = ['first_name', 'last_name']
 
-    @admin.display(description='Nominations total')
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            nominations=Count('nomination'),
+            nominations_verified=Count('nomination', filter=Q(nomination__is_verified=True)),
+        )
+
+    @admin.display(description='Nominations total', ordering='nominations')
     def count_nominations(self, obj):
-        return obj.nomination_set.count()
+        return obj.nominations
 
-    @admin.display(description='Nominations verified')
+    @admin.display(description='Nominations verified', ordering='nominations_verified')
     def count_nominations_verified(self, obj):
-        return obj.nomination_set.filter(is_verified=True).count()
+        return obj.nominations_verified
 
 
 @admin.register(Nomination)
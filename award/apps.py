@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class AwardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'award'
+
+    def ready(self):
+        from django.db.models import CharField
+
+        from . import signals  # noqa
+        from .lookups import TrigramWordSimilar
+
+        CharField.register_lookup(TrigramWordSimilar)
@@ -1,7 +1,8 @@
 from datetime import timedelta
 from django import forms
 from django.core.exceptions import ValidationError
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
 from django.http import HttpRequest
 from django.urls import reverse
 from django.utils import timezone
@@ -17,10 +18,12 @@ def strip_email_subdomain(email: str) -> (str, bool):
     return f"{user}@{host}", False
 
 
-def send_verification_email(nomination: Nomination, request: HttpRequest):
-    expiration = timezone.now() + timedelta(hours=24)
-    verification = Verification.objects.create(nomination=nomination, expiration=expiration)
+def get_expiration():
+    return timezone.now() + timedelta(hours=24)
 
+
+def create_verification_email(verification: Verification, request: HttpRequest) -> EmailMessage:
+    nomination = verification.nomination
     message = _("""Hello %(name)s,
 
 thank you for your nomination. As a last step, please confirm via this email that 
@@ -51,18 +54,18 @@ Twitter: https://twitter.com/sturaOVGU
 Instagram: https://www.instagram.com/stura_ovgu/
 """ % {
         'name': nomination.get_username(),
-        'expiry': timezone.make_naive(expiration),
+        'expiry': timezone.make_naive(verification.expiration),
         'url': request.build_absolute_uri(reverse('verify-token', kwargs={'token': verification.token})),
         'lecturer': nomination.lecturer.get_full_name(),
         'faculty': nomination.lecturer.get_faculty_display(),
         'reason': nomination.reason,
     })
 
-    send_mail(
+    return EmailMessage(
         subject=_("Your nomination for the teaching award of the student body"),
-        message=message,  # TODO Does not get translated?!?!?
+        body=message,  # TODO Does not get translated?!?!?
         from_email=None,
-        recipient_list=[nomination.get_valid_email()],
+        to=[nomination.get_valid_email()],
     )
 
 
@@ -132,8 +135,9 @@ class SubmissionForm(forms.Form):
                                                reason=self.cleaned_data['reason'],
                                                sub_email=sub_email,
                                                is_student=is_student)
+        verification = Verification.objects.create(nomination=nomination, expiration=get_expiration())
 
-        send_verification_email(nomination, request)
+        create_verification_email(verification, request).send()
 
 
 class RenewTokenForm(forms.Form):
@@ -165,18 +169,21 @@ class RenewTokenForm(forms.Form):
     def renew_tokens(self, request: HttpRequest):
         sub_email, is_student = strip_email_subdomain(self.cleaned_data['email'])
 
-        verifications = Verification.objects.filter(
-            nomination__sub_email=sub_email,
-            nomination__is_verified=False,
-        ).all()
-
-        for verification in verifications:
-            verification.delete()
-
         nominations = Nomination.objects.filter(
             sub_email=sub_email,
             is_verified=False,
-        ).all()
-
-        for nomination in nominations:
-            send_verification_email(nomination, request)
+        ).select_related('lecturer')
+
+        expiration = get_expiration()
+        with transaction.atomic():
+            Verification.objects.filter(
+                nomination__sub_email=sub_email,
+                nomination__is_verified=False,
+            ).delete()
+            verifications = Verification.objects.bulk_create([
+                Verification(nomination=nomination, expiration=expiration) for nomination in nominations
+            ])
+
+        # Emails are only sent after the new tokens have been committed and share a single connection
+        messages = [create_verification_email(verification, request) for verification in verifications]
+        get_connection().send_messages(messages)
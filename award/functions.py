@@ -0,0 +1,30 @@
+from django.db.models import CharField, F, FloatField, Func, Value
+
+
+class FullName(Func):
+    # Uses the immutable `||` operator instead of CONCAT() so PostgreSQL can
+    # match the expression against the trigram index on it
+    template = '(%(expressions)s)'
+    arg_joiner = " || ' ' || "
+    output_field = CharField()
+
+    def __init__(self, **extra):
+        super().__init__(F('first_name'), F('last_name'), **extra)
+
+
+class UnaccentLower(Func):
+    # Immutable lower(unaccent()) wrapper created by migration 0008. Applied to FullName() it
+    # matches the expression of lecturer_name_trgm_gin, so the `%>` search can use that index
+    function = 'f_unaccent_lower'
+    output_field = CharField()
+
+
+class TrigramWordSimilarity(Func):
+    # Backport of django.contrib.postgres.search.TrigramWordSimilarity, which Django 3.2 does not ship
+    function = 'WORD_SIMILARITY'
+    output_field = FloatField()
+
+    def __init__(self, string, expression, **extra):
+        if not hasattr(string, 'resolve_expression'):
+            string = Value(string)
+        super().__init__(string, expression, **extra)
@@ -0,0 +1,7 @@
+from django.db.models.lookups import PostgresOperatorLookup
+
+
+class TrigramWordSimilar(PostgresOperatorLookup):
+    # Backport of the trigram_word_similar lookup, which Django 3.2 does not ship
+    lookup_name = 'trigram_word_similar'
+    postgres_operator = '%%>'
@@ -0,0 +1,28 @@
+from django.db import migrations
+
+
+def create_name_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX lecturer_name_trgm_gin ON award_lecturer "
+        "USING GIN ((first_name || ' ' || last_name) gin_trgm_ops)"
+    )
+
+
+def drop_name_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS lecturer_name_trgm_gin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('award', '0004_lecturer_is_favorite'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_name_index, drop_name_index),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.4 on 2026-10-14 05:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('award', '0005_lecturer_name_trgm'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='nomination',
+            index=models.Index(fields=['lecturer', 'is_verified'], name='nomination_lecturer_verified'),
+        ),
+    ]
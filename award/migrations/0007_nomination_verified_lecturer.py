@@ -0,0 +1,21 @@
+# Generated by Django 3.2.4 on 2026-10-14 05:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('award', '0006_nomination_lecturer_verified'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='nomination',
+            name='nomination_lecturer_verified',
+        ),
+        migrations.AddIndex(
+            model_name='nomination',
+            index=models.Index(condition=models.Q(('is_verified', True)), fields=['lecturer'], name='nomination_verified_lecturer'),
+        ),
+    ]
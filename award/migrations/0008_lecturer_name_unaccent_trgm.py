@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+def create_unaccent_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+    # unaccent() is only STABLE, the wrapper pins the dictionary so it can be declared IMMUTABLE and indexed
+    schema_editor.execute(
+        "CREATE OR REPLACE FUNCTION f_unaccent_lower(text) RETURNS text AS "
+        "$$ SELECT lower(public.unaccent('public.unaccent'::regdictionary, $1)) $$ "
+        "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT"
+    )
+    schema_editor.execute("DROP INDEX IF EXISTS lecturer_name_trgm_gin")
+    schema_editor.execute(
+        "CREATE INDEX lecturer_name_trgm_gin ON award_lecturer "
+        "USING GIN (f_unaccent_lower(first_name || ' ' || last_name) gin_trgm_ops)"
+    )
+
+
+def drop_unaccent_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS lecturer_name_trgm_gin")
+    schema_editor.execute("DROP FUNCTION IF EXISTS f_unaccent_lower(text)")
+    schema_editor.execute(
+        "CREATE INDEX lecturer_name_trgm_gin ON award_lecturer "
+        "USING GIN ((first_name || ' ' || last_name) gin_trgm_ops)"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('award', '0007_nomination_verified_lecturer'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_unaccent_index, drop_unaccent_index),
+    ]
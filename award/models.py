@@ -60,6 +60,9 @@ class Nomination(models.Model):
             CheckConstraint(check=Q(sub_email__endswith='@ovgu.de'), name='check_domain_whitelist'),
             UniqueConstraint(fields=['lecturer', 'sub_email'], name='unique_nomination'),
         ]
+        indexes = [
+            models.Index(fields=['lecturer'], condition=Q(is_verified=True), name='nomination_verified_lecturer'),
+        ]
 
     lecturer = models.ForeignKey(Lecturer, on_delete=models.CASCADE)
     reason = models.TextField()
@@ -88,6 +91,10 @@ def generate_token():
     return secrets.token_urlsafe(12)
 
 
+def get_verification_cache_key(token: str) -> str:
+    return f'award:verification:{token}'
+
+
 class Verification(models.Model):
     token = models.CharField(max_length=16, primary_key=True, validators=[validate_slug], default=generate_token)
     nomination = models.ForeignKey(Nomination, on_delete=models.CASCADE)
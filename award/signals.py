@@ -0,0 +1,10 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import Verification, get_verification_cache_key
+
+
+@receiver(post_delete, sender=Verification)
+def invalidate_verification_cache(sender, instance, **kwargs):
+    cache.delete(get_verification_cache_key(instance.token))
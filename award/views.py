@@ -1,66 +1,123 @@
-from django.core.exceptions import FieldError
+from functools import lru_cache
+
+from django.core.cache import cache
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Q
-from django.http import HttpResponseRedirect
-from django.shortcuts import render, reverse, get_object_or_404
-from django.utils import timezone
+from django.db import connection
+from django.db.models import Count, Exists, OuterRef, Q, Value
+from django.http import Http404, HttpResponseRedirect
+from django.shortcuts import render, reverse
+from django.utils import timezone, translation
+from django.utils.formats import date_format
 from django.utils.translation import gettext_lazy as _
 from django.views import generic
-from markdown import markdown
 
 from .forms import SubmissionForm, RenewTokenForm
-from .models import Lecturer, Verification, Nomination
+from .functions import FullName, TrigramWordSimilarity, UnaccentLower
+from .models import Lecturer, Verification, Nomination, get_verification_cache_key
+
+
+STATS_CACHE_KEY = 'award:lecturer-list:stats'
+STATS_CACHE_TIMEOUT = 60
+
+VERIFICATION_CACHE_TIMEOUT = 30
+
+
+def get_stats():
+    return Nomination.objects.aggregate(
+        votes=Count('id'),
+        votes_verified=Count('id', filter=Q(is_verified=True)),
+        unique_users=Count('sub_email', distinct=True),
+    )
+
+
+MARKDOWN_TEXTS = {
+    'description': _("The **Teaching Award of the Student Body** honors lecturers with outstanding "
+                     "teaching. In particular, the conversion of their own teaching to digital means "
+                     "and the provision of additional teaching for students, due to the current "
+                     "pandemic situation, should be recognized. Not only professors can be nominated, "
+                     "but also any person who offers teaching at "
+                     "[Otto-von-Guericke-University Magdeburg](https://www.ovgu.de), e.g. lecturers "
+                     "or internship supervisors.\n"
+                     "\n"
+                     "The submitted nominations will be discussed at a meeting of the Student Council "
+                     "after the **submission deadline (%(month)s %(day)s, %(year)s)**, where the "
+                     "final winners will also be selected. In this process, the reasons submitted "
+                     "during the nomination process shall be predominantly included in the selection "
+                     "of the winners and the number of signed students shall only play a secondary "
+                     "role. In this way, we also want to give modules with a low number of "
+                     "participants an equal chance to have their "
+                     "teacher recognized."),
+    'submission-privacy': _("We need your email address to confirm your identity and prevent "
+                            "misrepresentation. The personal data will always be treated confidentially "
+                            "and will not be passed on to third parties. All submitted proposals will be "
+                            "kept for **a maximum of 6 months** and then irrevocably deleted."),
+    'submission-success': _("We have successfully received your nomination. **The last step is to confirm your "
+                            "nomination by clicking on the link we just sent you by email.** If you want to "
+                            "submit more nominations or sign already existing ones you can simply return to "
+                            "the [home page](%(url)s)."),
+    'renew-token-privacy': _("The entered email address is **not stored** by us. "
+                             "We will only use it for sending the required emails."),
+    'renew-token-success': _("We have just sent you a new email with a valid confirmation link for all "
+                             "open nominations. **Any old emails with a confirmation link that you "
+                             "still have in your inbox are no longer valid.**"),
+}
+
+
+@lru_cache(maxsize=32)
+def render_markdown(key, language):
+    # The language is only used as cache key, the translation itself uses the active language.
+    # Placeholders are kept in the rendered html and have to be substituted by the caller.
+    # Markdown is imported on first use so workers only load it when a text has to be rendered.
+    from markdown import markdown
+    return markdown(str(MARKDOWN_TEXTS[key]))
+
+
+@lru_cache(maxsize=None)
+def has_trigram_search():
+    # Probed once per process, migrations 0005 and 0008 install pg_trgm and f_unaccent_lower on PostgreSQL
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_proc WHERE proname = 'f_unaccent_lower'")
+        return cursor.fetchone() is not None
 
 
 class LecturerListView(generic.ListView):
     model = Lecturer
+    paginate_by = 50
 
     def post(self, request, *args, **kwargs):
         request.session['has_dismissed_language_info'] = True
         return HttpResponseRedirect(reverse('lecturer-list'))
 
     def get_queryset(self):
-        query = Lecturer.objects.filter(
-            nomination__is_verified=True
-        ).distinct()
+        query = Lecturer.objects.only('id', 'first_name', 'last_name', 'faculty').filter(
+            Exists(Nomination.objects.filter(lecturer=OuterRef('pk'), is_verified=True))
+        ).annotate(nomination_count=Count('nomination'))
         search = self.request.GET.get('q')
         if search:
-            for word in search.split(' '):
-                try:
-                    query = query.filter(
-                        Q(first_name__unaccent__lower__trigram_search=word) |
-                        Q(last_name__unaccent__lower__trigram_search=word)
-                    )
-                except FieldError:
-                    query = query.filter(
-                        Q(first_name__icontains=word) | Q(last_name__icontains=word)
-                    )
+            if has_trigram_search():
+                # Word similarity matches the search against the best fitting part of the name, so
+                # a single name or a prefix still matches (default pg_trgm threshold of 0.6)
+                term = UnaccentLower(Value(search))
+                query = query.annotate(
+                    full_name=UnaccentLower(FullName()),
+                    similarity=TrigramWordSimilarity(term, 'full_name'),
+                ).filter(full_name__trigram_word_similar=term)
+                return query.order_by('faculty', '-similarity', 'first_name', 'last_name')
+            for word in search.split():
+                query = query.filter(
+                    Q(first_name__icontains=word) | Q(last_name__icontains=word)
+                )
         return query.order_by('faculty', 'first_name', 'last_name')
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['stats'] = {
-            'votes': Nomination.objects.count(),
-            'votes_verified': Nomination.objects.filter(is_verified=True).count(),
-            'unique_users': Nomination.objects.values('sub_email').distinct().count(),
+        context['stats'] = cache.get_or_set(STATS_CACHE_KEY, get_stats, STATS_CACHE_TIMEOUT)
+        context['desc'] = render_markdown('description', translation.get_language()) % {
+            'year': "2021", 'month': _("June"), 'day': "20",
         }
-        context['desc'] = markdown(_("The **Teaching Award of the Student Body** honors lecturers with outstanding "
-                                     "teaching. In particular, the conversion of their own teaching to digital means "
-                                     "and the provision of additional teaching for students, due to the current "
-                                     "pandemic situation, should be recognized. Not only professors can be nominated, "
-                                     "but also any person who offers teaching at "
-                                     "[Otto-von-Guericke-University Magdeburg](https://www.ovgu.de), e.g. lecturers "
-                                     "or internship supervisors.\n"
-                                     "\n"
-                                     "The submitted nominations will be discussed at a meeting of the Student Council "
-                                     "after the **submission deadline (%(month)s %(day)s, %(year)s)**, where the "
-                                     "final winners will also be selected. In this process, the reasons submitted "
-                                     "during the nomination process shall be predominantly included in the selection "
-                                     "of the winners and the number of signed students shall only play a secondary "
-                                     "role. In this way, we also want to give modules with a low number of "
-                                     "participants an equal chance to have their "
-                                     "teacher recognized.") % {'year': "2021", 'month': _("June"), 'day': "20"})
         return context
 
 
@@ -71,10 +128,7 @@ class SubmissionFormView(generic.FormView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['privacy'] = markdown(_("We need your email address to confirm your identity and prevent "
-                                        "misrepresentation. The personal data will always be treated confidentially "
-                                        "and will not be passed on to third parties. All submitted proposals will be "
-                                        "kept for **a maximum of 6 months** and then irrevocably deleted."))
+        context['privacy'] = render_markdown('submission-privacy', translation.get_language())
         return context
 
     def get_initial(self):
@@ -92,18 +146,20 @@ class SubmissionSuccessView(generic.TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['feedback'] = markdown(
-            _("We have successfully received your nomination. **The last step is to confirm your "
-              "nomination by clicking on the link we just sent you by email.** If you want to "
-              "submit more nominations or sign already existing ones you can simply return to "
-              "the [home page](%(url)s).") % {'url': reverse('lecturer-list')})
+        context['feedback'] = render_markdown('submission-success', translation.get_language()) % {
+            'url': reverse('lecturer-list'),
+        }
         return context
 
 
 def verify_token(request, token):
-    try:
-        verification = Verification.objects.get(pk=token)
-    except Verification.DoesNotExist:
+    # Unknown tokens are cached as None as well, the entry is removed once the verification is deleted
+    verification = cache.get_or_set(
+        get_verification_cache_key(token),
+        lambda: Verification.objects.select_related('nomination__lecturer').filter(pk=token).first(),
+        VERIFICATION_CACHE_TIMEOUT,
+    )
+    if verification is None:
         feedback = {
             'valid_token': False,
             'title': _("Token does not exist"),
@@ -113,7 +169,7 @@ def verify_token(request, token):
         return render(request, 'award/verification.html', {'feedback': feedback})
 
     if timezone.now() > verification.expiration:
-        expiry = timezone.make_naive(verification.expiration)
+        expiry = date_format(timezone.localtime(verification.expiration), 'DATETIME_FORMAT')
         feedback = {
             'valid_token': False,
             'title': _("Token is expired"),
@@ -127,7 +183,7 @@ def verify_token(request, token):
     verification.delete()
 
     nomination.is_verified = True
-    nomination.save()
+    nomination.save(update_fields=['is_verified'])
 
     lecturer = nomination.lecturer
 
@@ -149,8 +205,7 @@ class RenewTokenView(generic.FormView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['privacy'] = markdown(_("The entered email address is **not stored** by us. "
-                                        "We will only use it for sending the required emails."))
+        context['privacy'] = render_markdown('renew-token-privacy', translation.get_language())
         return context
 
     def get_initial(self):
@@ -168,28 +223,31 @@ class RenewTokenSuccessView(generic.TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['feedback'] = markdown(_("We have just sent you a new email with a valid confirmation link for all "
-                                         "open nominations. **Any old emails with a confirmation link that you "
-                                         "still have in your inbox are no longer valid.**"))
+        context['feedback'] = render_markdown('renew-token-success', translation.get_language())
         return context
 
 
 @login_required
 def toggle_favorite_lecturer(request, pk):
-    lecturer = get_object_or_404(Lecturer, pk=pk)
+    lecturers = Lecturer.objects.filter(pk=pk)
 
     if request.method == 'POST':
+        # The form submits the current state, so the new state is its opposite
         value = request.POST.get('is-favorite', 'no')
-        if value == 'no':
-            lecturer.is_favorite = True
-        else:
-            lecturer.is_favorite = False
-        lecturer.save()
+        lecturers.update(is_favorite=(value == 'no'))
+
+    try:
+        lecturer = lecturers.annotate(
+            nominations=Count('nomination'),
+            nominations_verified=Count('nomination', filter=Q(nomination__is_verified=True)),
+        ).get()
+    except Lecturer.DoesNotExist:
+        raise Http404("No lecturer matches the given query.")
 
     context = {
         'lecturer': lecturer,
-        'nominations': lecturer.nomination_set.count(),
-        'nominations_verified': lecturer.nomination_set.filter(is_verified=True).count(),
+        'nominations': lecturer.nominations,
+        'nominations_verified': lecturer.nominations_verified,
     }
 
     return render(request, 'award/lecturer_detail.html', context)
@@ -201,11 +259,11 @@ class LecturerSelectView(LoginRequiredMixin, generic.ListView):
     template_name = 'award/lecturer_select.html'
 
     def get_queryset(self):
-        query = Lecturer.objects.distinct()
+        query = Lecturer.objects.only('id', 'first_name', 'last_name', 'is_favorite')
         faculty = self.request.GET.get('faculty')
         if faculty:
             query = query.filter(faculty=faculty)
-        return query
+        return query.order_by(*self.ordering)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data()